@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import functools
 import logging
 import os
@@ -21,6 +22,12 @@ from pydash.objects import get
 from rich.console import Console
 from simpleeval import simple_eval
 
+try:
+    # Use the libyaml-backed loader when available: it is ~5-10x faster than the pure Python one.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 console = Console()
 
 DIFFED_BRANCH = os.environ.get("DIFFED_BRANCH", "origin/master")
@@ -51,6 +58,17 @@ TEST_GRADLE_DEPENDENCIES = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_metadata_file(file_path: Path, file_mtime_ns: int) -> dict:
+    """Parse a metadata.yaml file, caching the result by path and mtime.
+
+    Metadata files are read over and over in a single process (each Connector property
+    that needs a metadata field re-reads the file), so cache the parsed document and
+    only re-parse when the file changes on disk.
+    """
+    return yaml.load(file_path.read_text(), Loader=SafeLoader)
+
+
 def download_catalog(catalog_url):
     response = requests.get(catalog_url)
     response.raise_for_status()
@@ -367,7 +385,8 @@ class Connector:
         file_path = self.metadata_file_path
         if not file_path.is_file():
             return None
-        return yaml.safe_load((self.code_directory / METADATA_FILE_NAME).read_text())["data"]
+        # Deep copy so callers mutating the returned metadata do not poison the process-wide cache
+        return copy.deepcopy(_parse_metadata_file(file_path, file_path.stat().st_mtime_ns)["data"])
 
     @property
     def language(self) -> ConnectorLanguage:
@@ -530,7 +549,7 @@ class Connector:
     def acceptance_test_config(self) -> Optional[dict]:
         try:
             with open(self.acceptance_test_config_path) as acceptance_test_config_file:
-                return yaml.safe_load(acceptance_test_config_file)
+                return yaml.load(acceptance_test_config_file, Loader=SafeLoader)
         except FileNotFoundError:
             logging.warning(f"No {ACCEPTANCE_TEST_CONFIG_FILE_NAME} file found for {self.technical_name}")
             return None
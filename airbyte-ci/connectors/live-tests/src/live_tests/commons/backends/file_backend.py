@@ -1,18 +1,20 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, TextIO
 
+import orjson
 from airbyte_protocol.models import AirbyteMessage  # type: ignore
 from airbyte_protocol.models import Type as AirbyteMessageType
 from cachetools import LRUCache, cached
 from live_tests.commons.backends.base_backend import BaseBackend
 from live_tests.commons.utils import sanitize_stream_name
 
+WRITE_BUFFER_SIZE = 1024 * 1024
+
 
 class FileDescriptorLRUCache(LRUCache):
     def popitem(self) -> tuple[Any, Any]:
@@ -95,7 +97,8 @@ class FileBackend(BaseBackend):
 
         @cached(cache=self.CACHE)
         def _open_file(path: Path) -> TextIO:
-            return open(path, "a")
+            # A large buffer keeps the per-message write cost down to a memory copy for high record counts
+            return open(path, "a", buffering=WRITE_BUFFER_SIZE)
 
         try:
             logging.info("Writing airbyte messages to disk")
@@ -119,14 +122,22 @@ class FileBackend(BaseBackend):
 
         elif message.type == AirbyteMessageType.RECORD:
             stream_name = message.record.stream
-            stream_file_path = self.record_per_stream_directory / f"{sanitize_stream_name(stream_name)}.jsonl"
-            stream_file_path_data_only = self.record_per_stream_directory / f"{sanitize_stream_name(stream_name)}_data_only.jsonl"
-            self.record_per_stream_paths[stream_name] = stream_file_path
-            self.record_per_stream_paths_data_only[stream_name] = stream_file_path_data_only
+            # The per-stream paths are cached so we only build them once per stream, not once per record
+            if stream_name not in self.record_per_stream_paths:
+                self.record_per_stream_paths[stream_name] = (
+                    self.record_per_stream_directory / f"{sanitize_stream_name(stream_name)}.jsonl"
+                )
+                self.record_per_stream_paths_data_only[stream_name] = (
+                    self.record_per_stream_directory / f"{sanitize_stream_name(stream_name)}_data_only.jsonl"
+                )
+            stream_file_path = self.record_per_stream_paths[stream_name]
+            stream_file_path_data_only = self.record_per_stream_paths_data_only[stream_name]
+            # Serialize the record once: the full message is written to both the global and per-stream files
+            record_json = message.json(sort_keys=True)
             return (self.RELATIVE_RECORDS_PATH, str(stream_file_path), str(stream_file_path_data_only),), (
-                message.json(sort_keys=True),
-                message.json(sort_keys=True),
-                json.dumps(message.record.data, sort_keys=True),
+                record_json,
+                record_json,
+                orjson.dumps(message.record.data, option=orjson.OPT_SORT_KEYS).decode(),
             )
 
         elif message.type == AirbyteMessageType.SPEC:
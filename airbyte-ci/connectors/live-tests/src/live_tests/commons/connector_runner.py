@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import datetime
-import json
 import logging
 import uuid
 from pathlib import Path
@@ -13,6 +12,7 @@ from typing import Optional
 import anyio
 import asyncer
 import dagger
+import orjson
 from live_tests.commons import errors
 from live_tests.commons.models import Command, ExecutionInputs, ExecutionResult
 from live_tests.commons.proxy import Proxy
@@ -112,9 +112,9 @@ class ConnectorRunner:
         for env_var_name, env_var_value in self.environment_variables.items():
             container = container.with_env_variable(env_var_name, env_var_value)
         if self.config:
-            container = container.with_new_file(self.IN_CONTAINER_CONFIG_PATH, contents=json.dumps(dict(self.config)))
+            container = container.with_new_file(self.IN_CONTAINER_CONFIG_PATH, contents=orjson.dumps(dict(self.config)).decode())
         if self.state:
-            container = container.with_new_file(self.IN_CONTAINER_STATE_PATH, contents=json.dumps(self.state))
+            container = container.with_new_file(self.IN_CONTAINER_STATE_PATH, contents=orjson.dumps(self.state).decode())
         if self.configured_catalog:
             container = container.with_new_file(
                 self.IN_CONTAINER_CONFIGURED_CATALOG_PATH,
@@ -175,11 +175,14 @@ class ConnectorRunner:
         start_time = datetime.datetime.utcnow()
         message = f"⏳ Still running {self.command.value} command"
         while not self.completion_event.is_set():
+            # Wait on the completion event instead of polling it every second:
+            # we wake up as soon as the command finishes, or after 10s to log progress.
+            with anyio.move_on_after(10):
+                await self.completion_event.wait()
+            if self.completion_event.is_set():
+                break
             duration = datetime.datetime.utcnow() - start_time
-            elapsed_seconds = duration.total_seconds()
-            if elapsed_seconds > 10 and round(elapsed_seconds) % 10 == 0:
-                self.logger.info(f"{message} (duration: {self.format_duration(duration)})")
-            await anyio.sleep(1)
+            self.logger.info(f"{message} (duration: {self.format_duration(duration)})")
 
     @staticmethod
     def format_duration(time_delta: datetime.timedelta) -> str:
@@ -1,7 +1,6 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 from __future__ import annotations
 
-import json
 import logging
 import tempfile
 from collections import defaultdict
@@ -10,13 +9,16 @@ from dataclasses import dataclass, field
 from enum import Enum
 from functools import cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import _collections_abc
+import asyncer
 import dagger
+import orjson
 import requests
 from airbyte_protocol.models import AirbyteCatalog  # type: ignore
 from airbyte_protocol.models import AirbyteMessage  # type: ignore
+from airbyte_protocol.models import AirbyteRecordMessage  # type: ignore
 from airbyte_protocol.models import AirbyteStateMessage  # type: ignore
 from airbyte_protocol.models import AirbyteStreamStatusTraceMessage  # type: ignore
 from airbyte_protocol.models import ConfiguredAirbyteCatalog  # type: ignore
@@ -32,9 +34,19 @@ from live_tests.commons.utils import (
     sanitize_stream_name,
     sort_dict_keys,
 )
-from mitmproxy import http
 from pydantic import ValidationError
 
+if TYPE_CHECKING:
+    from mitmproxy import http
+
+# Command outputs can weigh several GB; a large read buffer avoids one small read syscall
+# per ~8 KiB (the io default) when iterating over them line by line.
+COMMAND_OUTPUT_READ_BUFFER_SIZE = 1024 * 1024
+
+# Number of records per stream after which schema inference checks whether the inferred
+# schema is still changing; if it is not, the remaining records of the stream are skipped.
+SCHEMA_INFERENCE_STABILITY_CHECK_INTERVAL = 1000
+
 
 class UserDict(_collections_abc.MutableMapping):  # type: ignore
     # Start by filling-out the abstract methods
@@ -296,10 +308,38 @@ class ExecutionResult:
     def parse_airbyte_messages_from_command_output(
         self, command_output_path: Path, log_validation_errors: bool = False
     ) -> Iterable[AirbyteMessage]:
-        with open(command_output_path) as command_output:
+        """Parse the command output file into AirbyteMessages.
+
+        RECORD messages, which make up nearly all of the output on read commands, skip pydantic
+        validation and are built with construct: they were already validated by the connector and
+        full validation of every record dominates the parsing time. Other message types are rare
+        and keep the validated path.
+        """
+        with open(command_output_path, buffering=COMMAND_OUTPUT_READ_BUFFER_SIZE) as command_output:
             for line in command_output:
                 try:
-                    yield AirbyteMessage.parse_raw(line)
+                    raw_message = orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    if log_validation_errors:
+                        self.logger.warn(f"Error parsing AirbyteMessage: {e}")
+                    continue
+                # construct skips validation and leaves missing fields unset, so only take the
+                # fast path for records that carry their required fields; anything else goes
+                # through the validated path below, which logs and skips malformed lines.
+                if (
+                    isinstance(raw_message, dict)
+                    and raw_message.get("type") == "RECORD"
+                    and isinstance(raw_record := raw_message.get("record"), dict)
+                    and "stream" in raw_record
+                    and "data" in raw_record
+                ):
+                    yield AirbyteMessage.construct(
+                        type=AirbyteMessageType.RECORD,
+                        record=AirbyteRecordMessage.construct(**raw_record),
+                    )
+                    continue
+                try:
+                    yield AirbyteMessage.parse_obj(raw_message)
                 except ValidationError as e:
                     if log_validation_errors:
                         self.logger.warn(f"Error parsing AirbyteMessage: {e}")
@@ -313,18 +353,53 @@ class ExecutionResult:
                 yield message
 
     def generate_stream_schemas(self) -> dict[str, Any]:
+        """Infer a schema per stream from the record data.
+
+        genson walks every node of every record passed to add_object, which is expensive on
+        deeply nested records. Schemas usually stabilize within the first few thousand records,
+        so once the inferred schema of a stream has not changed over a full check interval we
+        stop feeding that stream's remaining records to the builder.
+        """
         self.logger.info("Generating stream schemas")
         stream_builders: dict[str, SchemaBuilder] = {}
-        for record in self.get_records():
-            stream = record.record.stream
+        stable_streams: set[str] = set()
+        records_since_check: dict[str, int] = {}
+        last_schema_fingerprint: dict[str, bytes] = {}
+        for stream, record_data in self._get_record_data_per_stream():
+            if stream in stable_streams:
+                continue
             if stream not in stream_builders:
                 stream_schema_builder = SchemaBuilder()
                 stream_schema_builder.add_schema({"type": "object", "properties": {}})
                 stream_builders[stream] = stream_schema_builder
-            stream_builders[stream].add_object(record.record.data)
+                records_since_check[stream] = 0
+            stream_builders[stream].add_object(record_data)
+            records_since_check[stream] += 1
+            if records_since_check[stream] >= SCHEMA_INFERENCE_STABILITY_CHECK_INTERVAL:
+                records_since_check[stream] = 0
+                fingerprint = orjson.dumps(stream_builders[stream].to_schema(), option=orjson.OPT_SORT_KEYS)
+                if last_schema_fingerprint.get(stream) == fingerprint:
+                    stable_streams.add(stream)
+                last_schema_fingerprint[stream] = fingerprint
         self.logger.info("Stream schemas generated")
         return {stream: sort_dict_keys(stream_builders[stream].to_schema()) for stream in stream_builders}
 
+    def _get_record_data_per_stream(self) -> Iterator[tuple[str, dict]]:
+        """Yield (stream name, record data) for all records of the execution.
+
+        Schema inference only needs the raw record data: when the backend already wrote the
+        per-stream data-only files we read those with plain orjson.loads, which avoids a second
+        full pydantic parse of the command output.
+        """
+        if self.backend is not None and self.backend.record_per_stream_paths_data_only:
+            for stream, data_only_path in self.backend.record_per_stream_paths_data_only.items():
+                with open(data_only_path, buffering=COMMAND_OUTPUT_READ_BUFFER_SIZE) as data_only_file:
+                    for line in data_only_file:
+                        yield stream, orjson.loads(line)
+        else:
+            for record in self.get_records():
+                yield record.record.stream, record.record.data
+
     def get_records_per_stream(self, stream: str) -> Iterator[AirbyteMessage]:
         assert self.backend is not None, "Backend must be set to get records per stream"
         self.logger.info(f"Reading records for stream {stream}")
@@ -338,6 +413,21 @@ class ExecutionResult:
                 if message.type is AirbyteMessageType.RECORD:
                     yield message
 
+    def get_record_count_for_stream(self, stream: str) -> int:
+        """Count the records of a stream without materializing AirbyteMessage models.
+
+        The per-stream artifact files hold one record per line, so counting lines is enough
+        and avoids building a pydantic model per record only to discard it.
+        """
+        assert self.backend is not None, "Backend must be set to count records per stream"
+        if stream not in self.backend.record_per_stream_paths:
+            return 0
+        record_count = 0
+        with open(self.backend.record_per_stream_paths[stream], buffering=COMMAND_OUTPUT_READ_BUFFER_SIZE) as record_file:
+            for _ in record_file:
+                record_count += 1
+        return record_count
+
     def get_states_per_stream(self, stream: str) -> Dict[str, List[AirbyteStateMessage]]:
         self.logger.info(f"Reading state messages for stream {stream}")
         states = defaultdict(list)
@@ -356,10 +446,13 @@ class ExecutionResult:
 
     @cache
     def get_message_count_per_type(self) -> dict[AirbyteMessageType, int]:
-        message_count: dict[AirbyteMessageType, int] = defaultdict(int)
+        # Preallocating the counters for all message types makes the per-message work a plain
+        # dict item increment, which matters when iterating over millions of messages.
+        message_count: dict[AirbyteMessageType, int] = {message_type: 0 for message_type in AirbyteMessageType}
         for message in self.airbyte_messages:
             message_count[message.type] += 1
-        return message_count
+        # Only report the message types that were actually emitted
+        return {message_type: count for message_type, count in message_count.items() if count}
 
     async def save_http_dump(self, output_dir: Path) -> None:
         if self.http_dump:
@@ -392,27 +485,36 @@ class ExecutionResult:
         stream_schemas_dir = output_dir / "stream_schemas"
         stream_schemas_dir.mkdir(parents=True, exist_ok=True)
         for stream_name, stream_schema in self.stream_schemas.items():
-            (stream_schemas_dir / f"{sanitize_stream_name(stream_name)}.json").write_text(json.dumps(stream_schema, sort_keys=True))
+            (stream_schemas_dir / f"{sanitize_stream_name(stream_name)}.json").write_bytes(
+                orjson.dumps(stream_schema, option=orjson.OPT_SORT_KEYS)
+            )
         self.logger.info("Stream schemas saved to disk")
 
     async def save_artifacts(self, output_dir: Path, duckdb_path: Optional[Path] = None) -> None:
         self.logger.info("Saving artifacts to disk")
-        self.save_airbyte_messages(output_dir, duckdb_path)
-        self.update_configuration()
-        await self.save_http_dump(output_dir)
-        self.save_stream_schemas(output_dir)
+        # The http dump export is dagger-bound I/O which is independent of message persistence,
+        # so it runs concurrently with the message writing and schema inference.
+        async with asyncer.create_task_group() as task_group:
+            task_group.soonify(self.save_http_dump)(output_dir)
+            task_group.soonify(self._save_messages_and_stream_schemas)(output_dir, duckdb_path)
         self.logger.info("All artifacts saved to disk")
 
+    async def _save_messages_and_stream_schemas(self, output_dir: Path, duckdb_path: Optional[Path]) -> None:
+        await asyncer.asyncify(self.save_airbyte_messages)(output_dir, duckdb_path)
+        await asyncer.asyncify(self.update_configuration)()
+        await asyncer.asyncify(self.save_stream_schemas)(output_dir)
+
     def get_updated_configuration(self, control_message_path: Path) -> Optional[dict[str, Any]]:
         """Iterate through the control messages to find CONNECTOR_CONFIG message and return the last updated configuration."""
         if not control_message_path.exists():
             return None
         updated_config = None
-        for line in control_message_path.read_text().splitlines():
-            if line.strip():
-                connector_config = json.loads(line.strip()).get("connectorConfig", {})
-                if connector_config:
-                    updated_config = connector_config
+        with open(control_message_path) as control_message_file:
+            for line in control_message_file:
+                if line.strip():
+                    connector_config = orjson.loads(line).get("connectorConfig", {})
+                    if connector_config:
+                        updated_config = connector_config
         return updated_config
 
     def update_configuration(self) -> None:
@@ -3,11 +3,12 @@ from __future__ import annotations
 
 import logging
 import uuid
+from pathlib import Path
 from typing import Optional
 
 import dagger
 
-from . import mitm_addons
+from .utils import sh_dash_c
 
 
 class Proxy:
@@ -18,7 +19,9 @@ class Proxy:
     MITMPROXY_IMAGE = "mitmproxy/mitmproxy:10.2.4"
     MITM_STREAM_FILE = "stream.mitm"
     PROXY_PORT = 8080
-    MITM_ADDONS_PATH = mitm_addons.__file__
+    # Resolved from the file system instead of importing mitm_addons: the addons module imports
+    # mitmproxy, which would otherwise be loaded eagerly by everything importing this module.
+    MITM_ADDONS_PATH = str(Path(__file__).parent / "mitm_addons.py")
 
     def __init__(
         self,
@@ -31,6 +34,7 @@ class Proxy:
         self.hostname = hostname
         self.session_id = session_id
         self.stream_for_server_replay = stream_for_server_replay
+        self._service: Optional[dagger.Service] = None
 
     @property
     def dump_cache_volume(self) -> dagger.CacheVolume:
@@ -100,7 +104,11 @@ class Proxy:
         return proxy_container.with_exec(command)
 
     async def get_service(self) -> dagger.Service:
-        return (await self.get_container()).with_exposed_port(self.PROXY_PORT).as_service()
+        # The service is memoized so that every container bound to this proxy shares the same
+        # mitmproxy service instead of declaring (and starting) a new one per bind.
+        if self._service is None:
+            self._service = (await self.get_container()).with_exposed_port(self.PROXY_PORT).as_service()
+        return self._service
 
     async def bind_container(self, container: dagger.Container) -> dagger.Container:
         """Bind a container to the proxy service and set environment variables to use the proxy for HTTP(S) traffic.
@@ -122,17 +130,19 @@ class Proxy:
             return await (
                 container.with_service_binding(self.hostname, await self.get_service())
                 .with_mounted_cache("/mitmproxy_dir", self.mitmproxy_dir_cache)
+                # Process the mitmproxy certificate in a single exec to avoid spawning one container layer per command
                 .with_exec(
-                    ["cp", cert_path_in_volume, requests_cert_path],
+                    sh_dash_c(
+                        [
+                            f"cp {cert_path_in_volume} {requests_cert_path}",
+                            f"cp {cert_path_in_volume} {ca_certificate_path}",
+                            "update-ca-certificates",
+                        ]
+                    ),
                     skip_entrypoint=True,
                 )
-                .with_exec(
-                    ["cp", cert_path_in_volume, ca_certificate_path],
-                    skip_entrypoint=True,
-                )
-                # The following command make the container use the proxy for all outgoing HTTP requests
+                # The following environment variables make the container use the proxy for all outgoing HTTP requests
                 .with_env_variable("REQUESTS_CA_BUNDLE", requests_cert_path)
-                .with_exec(["update-ca-certificates"], skip_entrypoint=True)
                 .with_env_variable("http_proxy", f"{self.hostname}:{self.PROXY_PORT}")
                 .with_env_variable("https_proxy", f"{self.hostname}:{self.PROXY_PORT}")
             )
@@ -1,20 +1,21 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
 import shutil
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import dagger
-import docker  # type: ignore
 import pytest
-from mitmproxy import http, io  # type: ignore
-from mitmproxy.addons.savehar import SaveHar  # type: ignore
 from slugify import slugify
 
+if TYPE_CHECKING:
+    from mitmproxy import http  # type: ignore
+
 
 async def get_container_from_id(dagger_client: dagger.Client, container_id: str) -> dagger.Container:
     """Get a dagger container from its id.
@@ -52,6 +53,9 @@ async def get_container_from_local_image(dagger_client: dagger.Client, local_ima
     Returns:
         Optional[dagger.Container]: The dagger container for the local image or None if the image does not exist
     """
+    # Imported lazily: the docker client is only needed for local images and is expensive to import
+    import docker  # type: ignore
+
     docker_client = docker.from_env()
 
     try:
@@ -135,6 +139,9 @@ def get_http_flows_from_mitm_dump(mitm_dump_path: Path) -> list[http.HTTPFlow]:
     Returns:
         List[http.HTTPFlow]: List of http flows.
     """
+    # Imported lazily: mitmproxy is only needed when processing http dumps and is expensive to import
+    from mitmproxy import http, io  # type: ignore
+
     with open(mitm_dump_path, "rb") as dump_file:
         return [f for f in io.FlowReader(dump_file).stream() if isinstance(f, http.HTTPFlow)]
 
@@ -149,14 +156,19 @@ def mitm_http_stream_to_har(mitm_http_stream_path: Path, har_file_path: Path) ->
     Returns:
         Path: Path to the har file.
     """
+    from mitmproxy.addons.savehar import SaveHar  # type: ignore
+
     flows = get_http_flows_from_mitm_dump(mitm_http_stream_path)
     SaveHar().export_har(flows, str(har_file_path))
     return har_file_path
 
 
+CONNECTION_ID_URL_PATTERN = re.compile(r"/connections/([a-f0-9\-]+)")
+WORKSPACE_ID_URL_PATTERN = re.compile(r"/workspaces/([a-f0-9\-]+)")
+
+
 def extract_connection_id_from_url(url: str) -> str:
-    pattern = r"/connections/([a-f0-9\-]+)"
-    match = re.search(pattern, url)
+    match = CONNECTION_ID_URL_PATTERN.search(url)
     if match:
         return match.group(1)
     else:
@@ -164,8 +176,7 @@ def extract_connection_id_from_url(url: str) -> str:
 
 
 def extract_workspace_id_from_url(url: str) -> str:
-    pattern = r"/workspaces/([a-f0-9\-]+)"
-    match = re.search(pattern, url)
+    match = WORKSPACE_ID_URL_PATTERN.search(url)
     if match:
         return match.group(1)
     else:
@@ -188,5 +199,7 @@ def sort_dict_keys(d: dict) -> dict:
         return d
 
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_stream_name(stream_name: str) -> str:
+    # Cached because it is called for every record when splitting messages per stream.
     return stream_name.replace("/", "_").replace(" ", "_").lower()
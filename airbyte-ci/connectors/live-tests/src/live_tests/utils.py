@@ -7,15 +7,12 @@ from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Union
 
-import docker  # type: ignore
 import pytest
 from airbyte_protocol.models import AirbyteCatalog, AirbyteMessage, ConnectorSpecification, Status, Type  # type: ignore
 from deepdiff import DeepDiff  # type: ignore
 from live_tests import stash_keys
 from live_tests.commons.models import ExecutionResult
 from live_tests.consts import MAX_LINES_IN_REPORT
-from mitmproxy import http, io  # type: ignore
-from mitmproxy.addons.savehar import SaveHar  # type: ignore
 
 if TYPE_CHECKING:
     from _pytest.fixtures import SubRequest
@@ -0,0 +1,60 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+from pathlib import Path
+
+from airbyte_protocol.models import AirbyteMessage, AirbyteRecordMessage
+from airbyte_protocol.models import Type as AirbyteMessageType
+from live_tests.commons.backends import FileBackend
+from live_tests.commons.models import Command, ConnectorUnderTest, ExecutionResult, TargetOrControl
+
+
+def record_message(stream: str, data: dict) -> AirbyteMessage:
+    return AirbyteMessage(
+        type=AirbyteMessageType.RECORD,
+        record=AirbyteRecordMessage(stream=stream, data=data, emitted_at=123456789),
+    )
+
+
+def get_execution_result(tmp_path: Path, messages: list[AirbyteMessage]) -> ExecutionResult:
+    backend = FileBackend(tmp_path / "artifacts")
+    backend.write(messages)
+    return ExecutionResult(
+        actor_id="test_actor",
+        connector_under_test=ConnectorUnderTest("airbyte/source-test:dev", None, TargetOrControl.CONTROL),
+        command=Command.READ,
+        stdout_file_path=tmp_path / "stdout.log",
+        stderr_file_path=tmp_path / "stderr.log",
+        success=True,
+        executed_container=None,
+        backend=backend,
+    )
+
+
+def test_get_record_count_for_stream(tmp_path):
+    messages = [
+        record_message("stream_a", {"id": 1}),
+        record_message("stream_a", {"id": 2}),
+        record_message("stream_b", {"id": 1}),
+        record_message("stream_a", {"id": 3}),
+    ]
+    execution_result = get_execution_result(tmp_path, messages)
+
+    assert execution_result.get_record_count_for_stream("stream_a") == 3
+    assert execution_result.get_record_count_for_stream("stream_b") == 1
+    assert execution_result.get_record_count_for_stream("unknown_stream") == 0
+
+
+def test_generate_stream_schemas_fully_consumes_evolving_stream(tmp_path, monkeypatch):
+    from live_tests.commons import models
+
+    monkeypatch.setattr(models, "SCHEMA_INFERENCE_STABILITY_CHECK_INTERVAL", 10)
+    # Each record introduces a new field so the inferred schema keeps changing
+    # across every stability checkpoint and inference must never stop early.
+    record_count = 35
+    messages = [record_message("evolving_stream", {f"field_{i}": i}) for i in range(record_count)]
+    execution_result = get_execution_result(tmp_path, messages)
+
+    stream_schemas = execution_result.generate_stream_schemas()
+
+    properties = stream_schemas["evolving_stream"]["properties"]
+    assert set(properties) == {f"field_{i}" for i in range(record_count)}
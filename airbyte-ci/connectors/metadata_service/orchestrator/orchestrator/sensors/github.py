@@ -34,9 +34,11 @@ def github_connector_nightly_workflow_run_sensor(job, resources_def) -> SensorDe
 
             latest_successful_workflow_runs = resources.github_connector_nightly_workflow_successes
 
-            # get all latest updated at value from the latest_successful_workflow_runs
-            last_successful_run_date = max(
-                [datetime.strptime(run["updated_at"], EXPECTED_DATETIME_FORMAT) for run in latest_successful_workflow_runs]
+            # get the latest updated at value from the latest_successful_workflow_runs
+            # The timestamps all follow EXPECTED_DATETIME_FORMAT so they compare lexicographically:
+            # we can find the latest run without parsing every timestamp.
+            last_successful_run_date = datetime.strptime(
+                max(run["updated_at"] for run in latest_successful_workflow_runs), EXPECTED_DATETIME_FORMAT
             )
 
             is_new_run = not cursor_as_datetime or cursor_as_datetime < last_successful_run_date
@@ -3,6 +3,7 @@
 #
 from __future__ import annotations
 
+import functools
 import re
 from typing import TYPE_CHECKING
 
@@ -27,6 +28,26 @@ if TYPE_CHECKING:
 
 PACKAGE_NAME_PATTERN = r"^([a-zA-Z0-9_.\-]+)(?:\[(.*?)\])?([=~><!]=?[a-zA-Z0-9\.]+)?$"
 
+# We use a session to reuse the TLS connection to PyPI across the many lookups a migration can trigger.
+PYPI_SESSION = requests.Session()
+
+
+@functools.lru_cache(maxsize=256)
+def get_latest_version_from_pypi(package_name: str) -> str:
+    """Get the latest published version of a package from PyPI.
+
+    The result is cached per package name: the same unpinned dependencies show up
+    in most connectors so there's no point in hitting PyPI more than once per package.
+    """
+    url = f"https://pypi.org/pypi/{package_name}/json"
+
+    # Send GET request to the PyPI API
+    response = PYPI_SESSION.get(url)
+    response.raise_for_status()  # Raise an exception for any HTTP error status
+
+    # The latest version is directly exposed in the "info" field of the response
+    return response.json()["info"]["version"]
+
 
 class CheckIsMigrationCandidate(Step):
     """Check if the connector is a candidate for migration to poetry.
@@ -135,27 +156,12 @@ class PoetryInit(Step):
                 # The package version is not pinned and not installed in the released connector
                 # It's because it's a test dependency
                 # Poetry requires version to be declared so we should get the latest version from PyPI
-                version = f"^{self.get_latest_version_from_pypi(name)}"
+                version = f"^{get_latest_version_from_pypi(name)}"
             if extras:
                 version = {"extras": extras, "version": version}
             dependencies[name] = version
         return dependencies
 
-    def get_latest_version_from_pypi(self, package_name: str) -> str:
-        url = f"https://pypi.org/pypi/{package_name}/json"
-
-        # Send GET request to the PyPI API
-        response = requests.get(url)
-        response.raise_for_status()  # Raise an exception for any HTTP error status
-
-        # Parse the JSON response
-        data = response.json()
-
-        # Extract the latest version from the response
-        latest_version = data["info"]["version"]
-
-        return latest_version
-
     async def get_dependencies(self, connector_container: dagger.Container, groups: Optional[List[str]] = None) -> set[str]:
         package = "." if not groups else f'.[{",".join(groups)}]'
         connector_container = await connector_container.with_exec(["pip", "install", package])
@@ -36,6 +36,8 @@ def with_python_base(context: PipelineContext, python_version: str = "3.10") ->
         context.dagger_client.container()
         .from_(f"python:{python_version}-slim")
         .with_mounted_cache("/root/.cache/pip", pip_cache)
+        # Skip pip's self-version check against PyPI: it adds a network round-trip to every pip invocation in derived containers.
+        .with_env_variable("PIP_DISABLE_PIP_VERSION_CHECK", "1")
         .with_exec(
             sh_dash_c(
                 [